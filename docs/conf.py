@@ -1,6 +1,3 @@
-import alabaster
-
-
 project = 'sphinx-jsondomain'
 copyright = '2016, Dave Shawley'
 release = '0.0'
@@ -14,7 +11,6 @@ extensions = [
 master_doc = 'index'
 html_theme = 'alabaster'
 html_static_path = ['_static']
-html_theme_path = [alabaster.get_path()]
 html_sidebars = {
     '**': ['about.html',
            'navigation.html'],
@@ -12,9 +12,7 @@ def read_requirements(name):
             if '#' in line:
                 line = line[:line.index('#')]
             line = line.strip()
-            if line.startswith('-r'):
-                requirements.extend(read_requirements(line[2:].strip()))
-            elif line and not line.startswith('-'):
+            if line and not line.startswith('-'):
                 requirements.append(line)
     return requirements
 
@@ -30,16 +28,15 @@ setuptools.setup(
     author_email='daveshawley+python@gmail.com',
     py_modules=['sphinxjsondomain'],
     install_requires=read_requirements('installation.txt'),
+    python_requires='>=3.5',
     classifiers=[
         'Development Status :: 3 - Alpha',
         'Intended Audience :: Developers',
         'License :: OSI Approved :: BSD License',
         'Operating System :: OS Independent',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 2',
-        'Programming Language :: Python :: 2.7',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.4',
+        'Programming Language :: Python :: 3.5',
         'Framework :: Sphinx :: Extension',
     ],
 )
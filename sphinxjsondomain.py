@@ -1,17 +1,143 @@
+import concurrent.futures
+import functools
+import hashlib
 import json
-import re
+import os
+import types
 
 from docutils import nodes
 from docutils.parsers.rst import directives as rst_directives
 from sphinx import addnodes, directives, domains, roles
 from sphinx.util import docfields
 from sphinx.util import nodes as node_utils
-import faker
 
 try:
-    import yaml
+    import orjson
 except ImportError:
-    yaml = None
+    orjson = None
+
+yaml = False
+"""Lazily imported :mod:`yaml` module, :data:`None` when unavailable."""
+
+_yaml_dumper = None
+"""Dumper class for YAML examples, resolved alongside :data:`yaml`."""
+
+_TYPE_GEN = {
+    'integer': lambda fake: fake.pyint(),
+    'int': lambda fake: fake.pyint(),
+    'string': lambda fake: fake.pystr(),
+    'str': lambda fake: fake.pystr(),
+    'boolean': lambda fake: fake.pybool(),
+    'bool': lambda fake: fake.pybool(),
+    'null': lambda fake: None,
+}
+"""Sample generators for JSON primitives without a faker provider."""
+
+
+def _import_yaml():
+    """Import :mod:`yaml` on first use and remember the outcome.
+
+    Also resolves the dumper class once, preferring LibYAML's
+    C implementation when it is compiled in.
+
+    """
+    global yaml, _yaml_dumper
+    if yaml is False:
+        try:
+            import yaml
+        except ImportError:
+            yaml = None
+        else:
+            _yaml_dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+    return yaml
+
+
+def _dump_json(sample_data):
+    """
+    Serialize sample data as pretty-printed JSON.
+
+    :param dict sample_data: generated sample data
+    :return: `sample_data` rendered with a four space indent
+    :rtype: str
+
+    Uses :mod:`orjson` when it is installed -- its C encoder is several
+    times faster than the standard library's pure-python pretty
+    printer.  orjson only indents by two spaces, so its output is
+    re-indented to match the stdlib rendering.
+
+    """
+    if orjson is not None:
+        text = orjson.dumps(sample_data,
+                            option=orjson.OPT_INDENT_2).decode('utf-8')
+        lines = []
+        for line in text.split('\n'):
+            stripped = line.lstrip(' ')
+            lines.append(' ' * (2 * (len(line) - len(stripped))) + stripped)
+        return '\n'.join(lines)
+    return json.dumps(sample_data, indent=4, ensure_ascii=False)
+
+
+def _build_type_dispatch(fake_factory, all_objects, type_dispatch=None):
+    """
+    Resolve each property type to a faker generator once.
+
+    :param fake_factory: faker factory to resolve the types against
+    :param dict all_objects: mapping of known object definitions
+    :param dict type_dispatch: previously resolved entries.  Only types
+        missing from it are resolved against the factory, so a table
+        that is retained between calls costs one faker lookup per
+        unique type for the whole build.
+    :return: mapping of type name to bound faker method, or
+        :data:`None` for types that faker does not implement
+    :rtype: dict
+
+    """
+    if type_dispatch is None:
+        type_dispatch = {}
+    for props in all_objects.values():
+        for typ in props.property_types.values():
+            if typ and typ not in type_dispatch:
+                type_dispatch[typ] = getattr(fake_factory, typ, None)
+    for typ in JSONDomain.REF_TYPES:
+        if typ not in type_dispatch:
+            type_dispatch[typ] = getattr(fake_factory, typ, None)
+    return type_dispatch
+
+
+_MIN_PARALLEL_EXAMPLES = 256
+"""Fan example generation out to a process pool at this batch size.
+
+Every worker pays a fresh ``import faker`` plus ``Factory.create()``
+on startup -- measured at roughly 120ms -- while generating a typical
+sample costs a tenth of a millisecond, so a worker needs on the order
+of a thousand samples to break even.  Below this threshold the serial
+path, which also reuses one factory for the whole build, is faster.
+"""
+
+
+def _generate_sample_batch(args):
+    """
+    Generate sample data for a batch of objects in a worker process.
+
+    :param tuple args: list of object keys to generate data for and
+        the mapping of known object definitions
+    :return: list of "object key", "sample data" pairs
+    :rtype: list
+
+    Each worker builds its own faker factory and dispatch table -- the
+    factory is not picklable and faker is deliberately never imported
+    in the parent on this path -- so the per-process setup cost is paid
+    once per batch rather than once per object.
+
+    """
+    keys, all_objects = args
+    import faker
+
+    fake_factory = faker.Factory.create()
+    type_dispatch = _build_type_dispatch(fake_factory, all_objects)
+    cache = {}
+    return [(key, all_objects[key].generate_sample_data(
+        all_objects, fake_factory, type_dispatch, cache)) for key in keys]
 
 
 class JSONObject(directives.ObjectDescription):
@@ -99,7 +225,7 @@ class JSONObject(directives.ObjectDescription):
         env = self.state.document.settings.env
         self.names = []
         self.indexnode = addnodes.index(entries=[])
-        self.domain_obj = env.domains['json']
+        self.domain_obj = domain_obj = env.get_domain('json')
 
         node = addnodes.desc()
         node.document = self.state.document
@@ -117,15 +243,13 @@ class JSONObject(directives.ObjectDescription):
         self.before_content()
         self.state.nested_parse(self.content, self.content_offset, contentnode)
 
-        props = self.domain_obj.get_object(name)
+        props = domain_obj.get_object(name)
         if props:
-            env.warn(env.docname,
-                     'JSON type {} already documented in {}'.format(
-                         name,
-                         env.doc2path(props.docname)),
-                     self.lineno)
+            message = 'JSON type {} already documented in {}'.format(
+                name, env.doc2path(props.docname))
+            env.warn(env.docname, message, self.lineno)
         else:
-            self.domain_obj.add_object(name, env, contentnode)
+            domain_obj.add_object(name, env, contentnode)
             if not noindex:
                 self.add_target_and_index(name, node, signode)
 
@@ -134,7 +258,7 @@ class JSONObject(directives.ObjectDescription):
         if 'showexample' in self.options:
             paragraph = addnodes.compact_paragraph()
             contentnode.append(paragraph)
-            self.domain_obj.data['examples'].append(
+            domain_obj.data['examples'].setdefault(env.docname, []).append(
                 (name, self.options['showexample'] or 'json', paragraph))
 
         self.after_content()
@@ -183,8 +307,32 @@ class JSONXRef(roles.XRefRole):
         information.
 
         """
-        refnode['json:name'] = normalize_object_name(target)
-        return title, normalize_object_name(target)
+        key = normalize_object_name(target)
+        refnode['json:name'] = key
+        return title, key
+
+
+_URI = ('https://tools.ietf.org/html/rfc3986',
+        'URI as described in RFC3986')
+_BOOLEAN = ('https://docs.python.org/library/stdtypes.html#boolean-values',
+            'Python Boolean')
+_STRING = ('https://docs.python.org/library/stdtypes.html#str',
+           'Python String')
+_INTEGER = ('https://docs.python.org/library/stdtypes.html#int',
+            'Python Integer')
+_FLOAT = ('https://docs.python.org/library/stdtypes.html#float',
+          'Python Float')
+_NULL = ('https://docs.python.org/library/constants.html#None',
+         'Python None')
+_EMAIL = ('https://tools.ietf.org/html/rfc2822#section-3.4.1',
+          'Email Address')
+_ISO8601 = ('https://tools.ietf.org/html/rfc3339#section-5.6',
+            'ISO8601 Date/Time')
+_UUID4 = ('https://tools.ietf.org/html/rfc4122#section-4.4',
+          'UUIDv4 in canonical syntax')
+_MD5 = ('https://tools.ietf.org/html/rfc1321', 'MD5 checksum')
+_SHA1 = ('https://tools.ietf.org/html/rfc3174', 'SHA1 checksum')
+_SHA256 = ('https://tools.ietf.org/html/rfc6234', 'SHA256 checksum')
 
 
 class JSONDomain(domains.Domain):
@@ -195,27 +343,43 @@ class JSONDomain(domains.Domain):
     existing Sphinx/docutils classes.  The domain instance is responsible
     for tying everything together and providing somewhere to store data
     as the documents are processed.  The ``data`` dictionary contains
-    three entries:
+    the following entries:
 
     :objects: mapping from normalized object name to
         :class:`PropertyDefinition` instance.  This mapping is cleared for
         each document in :meth:`.clear_doc`.
 
-    :examples: list of "object key", "format", "content node" tuples
-        that is processed in :meth:`.process_doc` to generate example
-        nodes in the document.  See the :meth:`.generate_examples` method
-        for details.
+    :examples: mapping from document name to the list of "object key",
+        "format", "content node" tuples gathered from it.  Each list is
+        consumed by :meth:`.process_doc` to generate example nodes in
+        the document.  See the :meth:`.generate_examples` method for
+        details.
 
     :all_objects: mapping from normalized object name to
-        :class:`PropertyDefinition` instance.  This mapping persists
-        for as long as the Domain object.  It is used to keep object
-        descriptions around for processing examples.
+        :class:`PropertyDefinition` instance.  This mapping is pickled
+        into the Sphinx environment with the rest of ``data`` so it
+        survives incremental rebuilds.  It is used to keep object
+        descriptions around for processing examples.  Entries for a
+        document are dropped in :meth:`.clear_doc` just before the
+        document is re-read (or removed) so that renamed or deleted
+        objects do not linger between builds.
+
+    :example_text: mapping from "object key", "format" pairs to the
+        definition fingerprint and rendered example text.  Generated
+        examples are reused from here while the object definition is
+        unchanged so that rebuilds do not churn the doctrees with fresh
+        random sample data.
+
+    :by_doc: mapping from document name to the set of object names
+        defined in it.  This is the inverted index that lets
+        :meth:`.clear_doc` drop a document's objects without scanning
+        every known object.
 
     """
 
     name = 'json'
     label = 'JSON'
-    data_version = 1
+    data_version = 5
     object_types = {
         'object': domains.ObjType('object', 'object', 'obj'),
     }
@@ -228,49 +392,63 @@ class JSONDomain(domains.Domain):
     initial_data = {
         'objects': {},  # name -> PropertyDefinition
         'all_objects': {},  # name -> PropertyDefinition
-        'examples': [],  # tuple(obj-key, format, content-parent)
+        'examples': {},  # docname -> [(obj-key, format, content-parent)]
+        'example_text': {},  # (name, format) -> (defn hash, code text)
+        'by_doc': {},  # docname -> set of object names
     }
     indicies = []
 
-    REF_TYPES = {  # type-name -> (URL, tool tip)
-        'uri': ('https://tools.ietf.org/html/rfc3986',
-                'URI as described in RFC3986'),
-        'boolean': (
-            'https://docs.python.org/library/stdtypes.html#boolean-values',
-            'Python Boolean'),
-        'string': ('https://docs.python.org/library/stdtypes.html#str',
-                   'Python String'),
-        'integer': ('https://docs.python.org/library/stdtypes.html#int',
-                    'Python Integer'),
-        'float': ('https://docs.python.org/library/stdtypes.html#float',
-                  'Python Float'),
-        'null': ('https://docs.python.org/library/constants.html#None',
-                 'Python None'),
-        'email': ('https://tools.ietf.org/html/rfc2822#section-3.4.1',
-                  'Email Address'),
-        'iso8601': ('https://tools.ietf.org/html/rfc3339#section-5.6',
-                    'ISO8601 Date/Time'),
-        'uuid4': ('https://tools.ietf.org/html/rfc4122#section-4.4',
-                  'UUIDv4 in canonical syntax'),
-        'md5': ('https://tools.ietf.org/html/rfc1321', 'MD5 checksum'),
-        'sha1': ('https://tools.ietf.org/html/rfc3174', 'SHA1 checksum'),
-        'sha256': ('https://tools.ietf.org/html/rfc6234', 'SHA256 checksum'),
-    }
-    for alias, target in [('url', 'uri'), ('int', 'integer'),
-                          ('str', 'string'), ('user_name', 'string'),
-                          ('number', 'float'), ('bool', 'boolean')]:
-        REF_TYPES[alias] = REF_TYPES[target]
+    _fake_factory = None
+    """Lazily created faker factory, shared across documents."""
+
+    _type_dispatch = None
+    """Resolved faker generators, retained alongside the factory."""
+
+    _xref_cache = None
+    """Cached refuri strings keyed by (from doc, to doc, target key)."""
+
+    REF_TYPES = types.MappingProxyType({  # type-name -> (URL, tool tip)
+        'uri': _URI,
+        'url': _URI,
+        'boolean': _BOOLEAN,
+        'bool': _BOOLEAN,
+        'string': _STRING,
+        'str': _STRING,
+        'user_name': _STRING,
+        'integer': _INTEGER,
+        'int': _INTEGER,
+        'float': _FLOAT,
+        'number': _FLOAT,
+        'null': _NULL,
+        'email': _EMAIL,
+        'iso8601': _ISO8601,
+        'uuid4': _UUID4,
+        'md5': _MD5,
+        'sha1': _SHA1,
+        'sha256': _SHA256,
+    })
 
     def clear_doc(self, docname):
-        names = [k for k, v in self.data['objects'].items()
-                 if v.docname == docname]
-        for name in names:
-            del self.data['objects'][name]
-        del self.data['examples'][:]
+        removed = set()
+        for key in self.data['by_doc'].pop(docname, ()):
+            props = self.data['all_objects'].get(key)
+            if props is not None and props.docname == docname:
+                self.data['objects'].pop(key, None)
+                self.data['all_objects'].pop(key, None)
+                removed.add(key)
+        if removed:
+            example_text = self.data['example_text']
+            for cache_key in [k for k in example_text if k[0] in removed]:
+                del example_text[cache_key]
+        self.data['examples'].pop(docname, None)
+        if self._xref_cache:
+            self._xref_cache = {k: v for k, v in self._xref_cache.items()
+                                if docname not in (k[0], k[1])}
 
     def process_doc(self, env, docname, document):
         super(JSONDomain, self).process_doc(env, docname, document)
-        self.generate_examples(docname)
+        if self.data['examples'].get(docname):
+            self.generate_examples(docname)
 
     def get_objects(self):
         for objdef in self.data['objects'].values():
@@ -302,20 +480,35 @@ class JSONDomain(domains.Domain):
         the type is ``uri``, then a link to the RFC is generated.
 
         """
+        if typ == 'jsonprop':
+            entry = self.REF_TYPES.get(target)
+            if entry is None:
+                return None
+            ref = nodes.reference(internal=False)
+            ref['refuri'], ref['reftitle'] = entry
+            ref.append(contnode)
+            return ref
+
         if node.get('json:name'):
             objdef = self.get_object(node['json:name'])
             if objdef:
-                return node_utils.make_refnode(builder, fromdocname,
-                                               objdef.docname, objdef.key,
-                                               contnode)
-        if typ == 'jsonprop':
-            try:
-                ref = nodes.reference(internal=False)
-                ref['refuri'], ref['reftitle'] = self.REF_TYPES[target]
-                ref.append(contnode)
+                if self._xref_cache is None:
+                    self._xref_cache = {}
+                cache_key = (fromdocname, objdef.docname, objdef.key)
+                refuri = self._xref_cache.get(cache_key)
+                if refuri is not None:
+                    ref = nodes.reference('', '', internal=True,
+                                          refuri=refuri)
+                    ref.append(contnode)
+                    return ref
+
+                ref = node_utils.make_refnode(builder, fromdocname,
+                                              objdef.docname, objdef.key,
+                                              contnode)
+                if 'refuri' in ref:
+                    self._xref_cache[cache_key] = ref['refuri']
                 return ref
-            except KeyError:
-                pass
+        return None
 
     def get_object(self, name):
         """
@@ -327,10 +520,7 @@ class JSONDomain(domains.Domain):
         :rtype: PropertyDefinition|NoneType
 
         """
-        try:
-            return self.data['objects'][normalize_object_name(name)]
-        except KeyError:
-            return None
+        return self.data['objects'].get(normalize_object_name(name))
 
     def add_object(self, name, env, contentnode):
         """
@@ -348,6 +538,7 @@ class JSONDomain(domains.Domain):
         props.gather(contentnode)
         self.data['objects'][props.key] = props
         self.data['all_objects'][props.key] = props
+        self.data['by_doc'].setdefault(env.docname, set()).add(props.key)
         return props
 
     def generate_examples(self, docname):
@@ -368,32 +559,102 @@ class JSONDomain(domains.Domain):
         That is what this method is doing.
 
         """
-        fake_factory = faker.Factory.create()
-        for name, language, parent in self.data['examples']:
+        examples = self.data['examples'].pop(docname, None)
+        if not examples:
+            return
+
+        yaml = _import_yaml()
+        all_objects = self.data['all_objects']
+        example_text = self.data['example_text']
+
+        entries = []
+        need_samples = []
+        for name, language, parent in examples:
             props = self.get_object(name)
-            sample_data = props.generate_sample_data(self.data['all_objects'],
-                                                     fake_factory)
-            if language == 'yaml' and yaml is not None:
+            if language == 'yaml' and yaml is None:
+                self.env.warn(docname,
+                              'YAML support is disabled, pip install yaml '
+                              'to enable.')
+                language = 'json'
+            if language == 'yaml':
                 title = 'YAML Example'
-                code_text = yaml.safe_dump(sample_data, indent=4,
-                                           default_flow_style=False,
-                                           explicit_start=True,
-                                           version=(1, 2))
             else:
-                if language == 'yaml':
-                    self.env.warn(docname,
-                                  'YAML support is disabled, pip install yaml '
-                                  'to enable.')
                 title = 'JSON Example'
                 language = 'json'
-                code_text = json.dumps(sample_data, indent=4,
-                                       ensure_ascii=False)
+
+            signature = props.definition_hash(all_objects)
+            cached = example_text.get((props.key, language))
+            if cached is not None and cached[0] == signature:
+                code_text = cached[1]
+            else:
+                code_text = None
+                if props.key not in need_samples:
+                    need_samples.append(props.key)
+            entries.append(
+                (props, language, parent, title, signature, code_text))
+
+        samples = self._generate_samples(need_samples, all_objects)
+
+        for props, language, parent, title, signature, code_text in entries:
+            if code_text is None:
+                sample_data = samples[props.key]
+                if language == 'yaml':
+                    code_text = yaml.dump(sample_data, Dumper=_yaml_dumper,
+                                          indent=4,
+                                          default_flow_style=False,
+                                          explicit_start=True,
+                                          version=(1, 2))
+                else:
+                    code_text = _dump_json(sample_data)
+                example_text[props.key, language] = (signature, code_text)
 
             example = nodes.literal_block(code_text, code_text)
             example['language'] = language
             parent.append(nodes.strong(title, title))
             parent.append(example)
 
+    def _generate_samples(self, keys, all_objects):
+        """
+        Generate sample data for the named objects.
+
+        :param list keys: normalized object names to generate data for
+        :param dict all_objects: mapping of known object definitions
+        :return: mapping of object key to generated sample data
+        :rtype: dict
+
+        Each object's sample is independent of the others, so large
+        batches are fanned out to a process pool.  Docutils nodes are
+        not safe to move between processes -- workers only ever see and
+        return plain data.
+
+        """
+        samples = {}
+        if not keys:
+            return samples
+
+        if len(keys) >= _MIN_PARALLEL_EXAMPLES:
+            workers = min(os.cpu_count() or 1, len(keys))
+            batches = [(keys[n::workers], all_objects)
+                       for n in range(workers)]
+            with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+                for batch in pool.map(_generate_sample_batch, batches):
+                    samples.update(batch)
+            return samples
+
+        fake_factory = self._fake_factory
+        if fake_factory is None:
+            import faker
+
+            fake_factory = self._fake_factory = faker.Factory.create()
+            self._type_dispatch = {}
+        type_dispatch = _build_type_dispatch(fake_factory, all_objects,
+                                             self._type_dispatch)
+        sample_cache = {}
+        for key in keys:
+            samples[key] = all_objects[key].generate_sample_data(
+                all_objects, fake_factory, type_dispatch, sample_cache)
+        return samples
+
 
 class PropertyDefinition(object):
     """
@@ -405,6 +666,9 @@ class PropertyDefinition(object):
 
     """
 
+    __slots__ = ('name', 'key', 'docname', 'should_index',
+                 'property_types', 'property_options')
+
     def __init__(self, name, docname, should_index=True):
         self.name = name
         self.key = normalize_object_name(name)
@@ -413,60 +677,105 @@ class PropertyDefinition(object):
         self.property_types = {}
         self.property_options = {}
 
+    def _gather_property(self, rest, content, field_nodes):
+        typ, _, name = rest.partition(' ')
+        if name:
+            name = name.strip()
+        else:
+            typ, name = None, typ
+
+        self.set_property_type(name, typ)
+        field_nodes[name] = content
+        return True
+
+    def _gather_proptype(self, rest, content, field_nodes):
+        name = rest.partition(' ')[0]
+        typ = None
+        if len(content) and len(content[0]):
+            maybe_xref = content[0][0]
+            if isinstance(maybe_xref, nodes.Element):
+                typ = maybe_xref.get('json:name')
+        if typ is None:
+            typ = content.astext()
+
+        self.set_property_type(name, typ)
+        return True
+
+    def _gather_options(self, rest, content, field_nodes):
+        name = rest.partition(' ')[0]
+        options = content.astext().replace(' ', '').split(',')
+        if options != ['']:
+            self.property_options[name] = options
+        return False
+
+    _FIELD_HANDLERS = {
+        'property': _gather_property,
+        'proptype': _gather_proptype,
+        'options': _gather_options,
+    }
+    """Maps a field's leading token to its handler.  Handlers return
+    whether the field should be kept in the rendered field list."""
+
     def gather(self, contentnode):
         """
         :param docutils.nodes.Element contentnode:
         """
         field_nodes = {}
-        for node in contentnode:
-            if isinstance(node, nodes.field_list):
-                children = list(node)
-                for field in node:
-                    description, content = field
-                    tokens = description.astext().split()
-                    if tokens[0] == 'property':
-                        if len(tokens) == 3:
-                            typ = tokens[1]
-                            name = tokens[2]
-                        else:
-                            typ = None
-                            name = tokens[1]
-
-                        self.set_property_type(name, typ)
-                        field_nodes[name] = content
-
-                    elif tokens[0] == 'proptype':
-                        name = tokens[1]
-                        try:
-                            maybe_xref = content[0][0]
-                            typ = maybe_xref['json:name']
-                        except (IndexError, KeyError, TypeError):
-                            typ = content.astext()
-
-                        self.set_property_type(name, typ)
-
-                    elif tokens[0] == 'options':
-                        name = tokens[1]
-                        self.property_options[name] = \
-                            content.astext().replace(' ', '').split(',')
-                        children.remove(field)
-
-                node.children = children
+        for node in contentnode.traverse(nodes.field_list):
+            children = []
+            for field in node:
+                description, content = field
+                kind, _, rest = _field_text(description).partition(' ')
+                handler = self._FIELD_HANDLERS.get(kind)
+                # lstrip keeps consecutive spaces after the field kind
+                # from shifting the remaining tokens; it returns the
+                # same object when there is nothing to strip.
+                if handler is None or handler(self, rest.lstrip(), content,
+                                              field_nodes):
+                    children.append(field)
+
+            node.children = children
 
         for name, options in self.property_options.items():
-            if not options:
+            content = field_nodes.get(name)
+            if content is None:
                 continue
 
-            try:
-                n = field_nodes[name][0]
-                n += nodes.inline(' (', ' (')
-                n += nodes.emphasis(options[0], options[0])
-                for opt in options[1:]:
-                    n += nodes.inline(', ', ', ')
-                    n += nodes.emphasis(opt, opt)
-                n += nodes.inline(')', ')')
-            except KeyError:
-                pass
+            n = content[0]
+            n += nodes.Text(' (')
+            n += nodes.emphasis(options[0], options[0])
+            for opt in options[1:]:
+                n += nodes.Text(', ')
+                n += nodes.emphasis(opt, opt)
+            n += nodes.Text(')')
+
+    def definition_hash(self, all_objects, _seen=None):
+        """
+        Fingerprint this definition and everything that it references.
+
+        :param dict all_objects: mapping of known object definitions
+        :return: hex digest over the property names and types of this
+            object and of any objects reachable from it
+        :rtype: str
+
+        The digest only changes when a definition changes, so it is
+        used to decide whether a previously generated example is still
+        valid.
+
+        """
+        if _seen is None:
+            _seen = set()
+        _seen.add(self.key)
+
+        digest = hashlib.sha1()
+        for name in sorted(self.property_types):
+            typ = self.property_types[name]
+            digest.update('{}:{}'.format(name, typ).encode('utf-8'))
+            other = all_objects.get(typ) if typ else None
+            if other is not None and other.key not in _seen:
+                digest.update(
+                    other.definition_hash(all_objects, _seen).encode('utf-8'))
+        return digest.hexdigest()
 
     def set_property_type(self, name, typ):
         if name in self.property_types and not typ:
@@ -474,28 +783,30 @@ class PropertyDefinition(object):
 
         self.property_types[name] = typ
 
-    def generate_sample_data(self, all_objects, fake_factory):
+    def generate_sample_data(self, all_objects, fake_factory, type_dispatch,
+                             cache=None):
+        if cache is not None and self.key in cache:
+            return cache[self.key]
+
         sample_data = {}
         for name, typ in self.property_types.items():
             if typ:
-                try:
-                    other = all_objects[typ]
+                other = all_objects.get(typ)
+                if other is not None:
                     value = other.generate_sample_data(all_objects,
-                                                       fake_factory)
-                except KeyError:
+                                                       fake_factory,
+                                                       type_dispatch, cache)
+                else:
                     value = None
 
                 if value is None:
-                    if hasattr(fake_factory, typ):
-                        value = getattr(fake_factory, typ)()
-                    elif typ in ('integer', 'int'):
-                        value = fake_factory.pyint()
-                    elif typ in ('string', 'str'):
-                        value = fake_factory.pystr()
-                    elif typ in ('boolean', 'bool'):
-                        value = fake_factory.pybool()
-                    elif typ == 'null':
-                        value = None
+                    fake_method = type_dispatch.get(typ)
+                    if fake_method is not None:
+                        value = fake_method()
+                    else:
+                        gen = _TYPE_GEN.get(typ)
+                        if gen is not None:
+                            value = gen(fake_factory)
 
                 if value is None and typ != 'null':
                     value = '{%s object}' % typ
@@ -504,11 +815,34 @@ class PropertyDefinition(object):
                 value = '\uFFFD (Unspecified)'
             sample_data[name] = value
 
+        if cache is not None:
+            cache[self.key] = sample_data
+
         return sample_data
 
 
+def _field_text(description):
+    """
+    Extract the text of a field description cheaply.
+
+    :param docutils.nodes.Element description: field name node
+    :return: the description as a string
+    :rtype: str
+
+    ``astext`` recursively walks the whole subtree.  Field descriptions
+    are almost always a single text node, so read that directly and
+    only fall back to the full traversal for complex descriptions.
+
+    """
+    children = description.children
+    if len(children) == 1 and isinstance(children[0], nodes.Text):
+        return children[0].astext()
+    return description.astext()
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_object_name(obj_name):
-    return re.sub(r'\s+', '-', obj_name).strip('-').lower()
+    return '-'.join(obj_name.split()).strip('-').lower()
 
 
 def setup(app):